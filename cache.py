@@ -1,37 +1,479 @@
+import hashlib
+import io
 import pickle
 import os
 import time
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
 from functools import wraps
 
-def cache(cache_file):
+try:
+    import fcntl
+except ImportError:  # Windows: only threads within one process are serialized.
+    fcntl = None
+
+try:
+    import msgpack
+except ImportError:  # Only needed for serializer="msgpack".
+    msgpack = None
+
+try:
+    import zstandard as zstd
+except ImportError:  # Only needed for compress=True.
+    zstd = None
+
+# The cache file is an append-only log of (key, value) frames.
+# _MEMCACHE indexes every loaded file, keyed by cache_file, mapping each
+# cache_key to the offset of its frame, and _FRAME_COUNTS tracks how many
+# frames each file holds on disk. Values themselves are read from disk on
+# demand and kept in a per-function LRU. _FORMATS records the serializer
+# name each loaded file was checked against.
+_MEMCACHE = {}
+_FRAME_COUNTS = {}
+_FORMATS = {}
+_MISSING = object()
+
+# One lock per cache file serializes index and log updates between threads.
+# Only the bookkeeping is locked, the decorated function runs outside the lock.
+_FILE_LOCKS = {}
+_LOCKS_LOCK = threading.Lock()
+
+# Scans, compactions and appends go through a large buffer so the many
+# small reads/writes the serializer issues are coalesced into few syscalls.
+_BUFFER_SIZE = 1 << 20
+
+# Every log starts with a header naming the format of its frames, e.g.
+# b"UTILS-CACHE/1 pickle\n". Logs written before headers existed have none;
+# they are recognized by the first byte of their first frame and get a
+# header when they are next compacted.
+_HEADER_MAGIC = b"UTILS-CACHE/1 "
+_HEADERLESS_FORMATS = {b"\x80": "pickle", b"\x92": "msgpack"}
+
+# Keys are stored as fixed-size digests of the pickled call arguments. The
+# protocol is pinned so keys stay stable when HIGHEST_PROTOCOL moves on.
+_KEY_PROTOCOL = 5
+_KEY_DIGEST_SIZE = 16
+
+
+class _TruncatedLogError(Exception):
+    pass
+
+
+# Values that cannot contain shared or cyclic references, so the pickler's
+# memo is pure overhead when writing them.
+_FLAT_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+class _PickleSerializer:
+
+    name = "pickle"
+
+    @staticmethod
+    def dump(frame, f):
+        pickler = pickle.Pickler(f, protocol=pickle.HIGHEST_PROTOCOL)
+        pickler.fast = type(frame[1]) in _FLAT_TYPES
+        pickler.dump(frame)
+
+    @staticmethod
+    def dumps(obj):
+        return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def loads(data):
+        return pickle.loads(data)
+
+    @staticmethod
+    def load(f):
+        return pickle.load(f)
+
+    @staticmethod
+    def iter_frames(f):
+        while True:
+            offset = f.tell()
+            try:
+                frame = pickle.load(f)
+            except EOFError:
+                return
+            except pickle.UnpicklingError:
+                raise _TruncatedLogError
+            yield offset, frame
+
+
+class _MsgpackSerializer:
+    """Compact binary frames for JSON-shaped results (str, dict, list, numbers)."""
+
+    name = "msgpack"
+
+    @staticmethod
+    def dump(frame, f):
+        f.write(msgpack.packb(frame, use_bin_type=True))
+
+    @staticmethod
+    def dumps(obj):
+        return msgpack.packb(obj, use_bin_type=True)
+
+    @staticmethod
+    def loads(data):
+        return msgpack.unpackb(data, raw=False)
+
+    @staticmethod
+    def load(f):
+        try:
+            return msgpack.Unpacker(f, raw=False).unpack()
+        except msgpack.OutOfData:
+            raise EOFError
+
+    @staticmethod
+    def iter_frames(f):
+        # The unpacker counts from where it starts reading, i.e. after the header.
+        start = f.tell()
+        unpacker = msgpack.Unpacker(f, raw=False)
+        offset = start
+        try:
+            for frame in unpacker:
+                yield offset, frame
+                offset = start + unpacker.tell()
+        except ValueError:
+            raise _TruncatedLogError
+        if offset < os.fstat(f.fileno()).st_size:
+            raise _TruncatedLogError
+
+
+_SERIALIZERS = {
+    "pickle": _PickleSerializer,
+    "msgpack": _MsgpackSerializer,
+}
+
+
+# Every zstd frame starts with these bytes.
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+class _ZstdSerializer:
+    """
+    Wraps another serializer and stores each value as an independent zstd
+    frame, so log offsets and single-frame reads keep working unchanged.
+    """
+
+    def __init__(self, inner, level=3):
+        self.inner = inner
+        self.level = level
+        self.name = inner.name + "+zstd"
+
+    def dump(self, frame, f):
+        cache_key, result = frame
+        blob = zstd.ZstdCompressor(level=self.level).compress(self.inner.dumps(result))
+        self.inner.dump((cache_key, blob), f)
+
+    def load(self, f):
+        return self._decompress(self.inner.load(f))
+
+    def iter_frames(self, f):
+        for offset, frame in self.inner.iter_frames(f):
+            yield offset, self._decompress(frame)
+
+    def _decompress(self, frame):
+        if isinstance(frame, dict):
+            return frame  # Legacy single-dict file, always uncompressed.
+        cache_key, blob = frame
+        if not (isinstance(blob, bytes) and blob.startswith(_ZSTD_MAGIC)):
+            # Uncompressed frame of a headerless log, written before
+            # compression was enabled for it. Tagged "+zstd" logs have none.
+            return cache_key, blob
+        try:
+            return cache_key, self.inner.loads(zstd.ZstdDecompressor().decompress(blob))
+        except zstd.ZstdError as e:
+            raise ValueError(f"Corrupt compressed cache frame: {e}")
+
+
+class _DictKey(tuple):
+    """Sorted items of a dict argument, pickled apart from a plain tuple."""
+
+
+class _SetKey(tuple):
+    """Sorted members of a set argument, pickled apart from a plain tuple."""
+
+
+def _dumps_key(obj):
+    # The memo is disabled so the bytes depend on values only, not on which
+    # arguments happen to be the same object.
+    buf = io.BytesIO()
+    pickler = pickle.Pickler(buf, protocol=_KEY_PROTOCOL)
+    pickler.fast = True
+    pickler.dump(obj)
+    return buf.getvalue()
+
+
+def _canonical(obj):
+    # Map equal arguments to identical structures, the way dict keys compare:
+    # True, 1 and 1.0 are one key, and dict/set order does not matter.
+    cls = type(obj)
+    if cls is str or cls is bytes or obj is None:
+        return obj
+    if cls is bool:
+        return int(obj)
+    if cls is float:
+        return int(obj) if obj.is_integer() else obj
+    if cls is tuple:
+        return tuple(map(_canonical, obj))
+    if cls is list:
+        return list(map(_canonical, obj))
+    if cls is dict:
+        items = ((_canonical(k), _canonical(v)) for k, v in obj.items())
+        return _DictKey(sorted(items, key=_dumps_key))
+    if cls is set or cls is frozenset:
+        return _SetKey(sorted(map(_canonical, obj), key=_dumps_key))
+    return obj
+
+
+def _make_key(key):
+    key_bytes = _dumps_key(_canonical(key))
+    return hashlib.blake2b(key_bytes, digest_size=_KEY_DIGEST_SIZE).digest()
+
+
+def _read_format(cache_file, f, serializer):
+    # Check that the log at f was written with this serializer, leaving f at
+    # its first frame. Returns True for a headerless log from an older version.
+    head = f.read(len(_HEADER_MAGIC))
+    if not head:
+        return False
+    if head == _HEADER_MAGIC:
+        found, headerless = f.readline().rstrip(b"\n").decode("ascii", "replace"), False
+        expected = serializer.name
+    else:
+        f.seek(0)
+        found, headerless = _HEADERLESS_FORMATS.get(head[:1]), True
+        expected = serializer.name.partition("+")[0]
+    if found != expected:
+        raise _format_error(cache_file, found, serializer)
+    return headerless
+
+
+def _format_error(cache_file, found, serializer):
+    return ValueError(
+        f"Cache file {cache_file!r} holds "
+        + (f"'{found}' frames" if found else "data not written by cache()")
+        + f", but this cache uses '{serializer.name}'. Use the settings the"
+        " file was written with, or a different cache_file."
+    )
+
+
+def _write_header(f, serializer):
+    f.write(_HEADER_MAGIC + serializer.name.encode("ascii") + b"\n")
+
+
+def _iter_entries(f, serializer):
+    # Yields (offset, cache_key, result). The offset is None for entries in
+    # an older format, which only become addressable after a compaction.
+    for offset, frame in serializer.iter_frames(f):
+        if isinstance(frame, dict):
+            # Legacy format: the whole cache pickled as one dict.
+            for cache_key, result in frame.items():
+                yield None, _make_key(cache_key), result
+        elif not isinstance(frame[0], bytes):
+            # Frame written before keys were hashed.
+            yield None, _make_key(frame[0]), frame[1]
+        else:
+            yield offset, frame[0], frame[1]
+
+
+@contextmanager
+def _locked_log(cache_file):
+    # Open the log for appending while holding an exclusive flock on it, so
+    # processes sharing the file never interleave frames.
+    while True:
+        f = io.BufferedWriter(open(cache_file, 'ab', buffering=0), buffer_size=_BUFFER_SIZE)
+        if fcntl is None:
+            break
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            if os.fstat(f.fileno()).st_ino == os.stat(cache_file).st_ino:
+                break
+        except FileNotFoundError:
+            pass
+        # Another process compacted the log while we waited, retry on the new file.
+        f.close()
+
+    try:
+        f.seek(0, os.SEEK_END)
+        yield f
+        f.flush()
+    finally:
+        f.close()
+
+
+def _load_cache_file(cache_file, serializer, compact_threshold):
+    index = {}
+    frames = 0
+    needs_compact = False
+
+    try:
+        with open(cache_file, 'rb', buffering=_BUFFER_SIZE) as f:
+            needs_compact = _read_format(cache_file, f, serializer)
+            for offset, cache_key, _ in _iter_entries(f, serializer):
+                if offset is None:
+                    needs_compact = True
+                else:
+                    index[cache_key] = offset
+                    frames += 1
+    except FileNotFoundError:
+        pass
+    except _TruncatedLogError:
+        # Truncated trailing frame (interrupted write), drop it.
+        needs_compact = True
+
+    _MEMCACHE[cache_file] = index
+    _FRAME_COUNTS[cache_file] = frames
+    _FORMATS[cache_file] = serializer.name
+    if needs_compact or frames - len(index) > compact_threshold:
+        _compact(cache_file, serializer)
+    return index
+
+
+def _compact(cache_file, serializer):
+    # Rewrite the log with one frame per key, dropping stale frames. The log
+    # is re-read under the flock so frames appended by other processes survive.
+    # Windows has no flock, and cannot replace a file that is still open.
+    lock = _locked_log(cache_file) if fcntl is not None else nullcontext()
+    with lock:
+        entries = {}
+        try:
+            with open(cache_file, 'rb', buffering=_BUFFER_SIZE) as f:
+                _read_format(cache_file, f, serializer)
+                for _, cache_key, result in _iter_entries(f, serializer):
+                    entries[cache_key] = result
+        except _TruncatedLogError:
+            pass
+
+        index = {}
+        tmp_file = cache_file + '.tmp'
+        with open(tmp_file, 'wb', buffering=_BUFFER_SIZE) as out:
+            _write_header(out, serializer)
+            for cache_key, result in entries.items():
+                index[cache_key] = out.tell()
+                serializer.dump((cache_key, result), out)
+        os.replace(tmp_file, cache_file)
+
+    _MEMCACHE[cache_file].clear()
+    _MEMCACHE[cache_file].update(index)
+    _FRAME_COUNTS[cache_file] = len(index)
+
+
+def _lookup(cache_file, cache_key, serializer, compact_threshold, reindex=True):
+    index = _MEMCACHE.get(cache_file)
+    if index is None:
+        index = _load_cache_file(cache_file, serializer, compact_threshold)
+    elif _FORMATS[cache_file] != serializer.name:
+        # Loaded earlier in this process by a cache() with other settings.
+        raise _format_error(cache_file, _FORMATS[cache_file], serializer)
+
+    offset = index.get(cache_key)
+    if offset is None:
+        return _MISSING
+
+    try:
+        with open(cache_file, 'rb') as f:
+            f.seek(offset)
+            frame_key, result = serializer.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+        frame_key = _MISSING
+
+    if frame_key != cache_key:
+        # The file was rewritten under us (e.g. by another process), re-index it.
+        if not reindex:
+            return _MISSING
+        del _MEMCACHE[cache_file]
+        return _lookup(cache_file, cache_key, serializer, compact_threshold, reindex=False)
+    return result
+
+
+def _append(cache_file, cache_key, result, serializer, compact_threshold):
+    index = _MEMCACHE[cache_file]
+    # Serialize before touching the log, so a result that cannot be
+    # serialized leaves neither a partial frame nor an index entry behind.
+    buf = io.BytesIO()
+    serializer.dump((cache_key, result), buf)
+    frame = buf.getvalue()
+    with _locked_log(cache_file) as f:
+        if f.tell() == 0:
+            _write_header(f, serializer)
+        offset = f.tell()
+        f.write(frame)
+    index[cache_key] = offset
+    _FRAME_COUNTS[cache_file] += 1
+
+    # Frames for keys that were written more than once (e.g. by two
+    # threads missing on the same key at once) are dead weight on disk.
+    if _FRAME_COUNTS[cache_file] - len(index) > compact_threshold:
+        _compact(cache_file, serializer)
+
+
+def _get_file_lock(cache_file):
+    with _LOCKS_LOCK:
+        lock = _FILE_LOCKS.get(cache_file)
+        if lock is None:
+            lock = _FILE_LOCKS[cache_file] = threading.Lock()
+        return lock
+
+
+def cache(
+    cache_file,
+    compact_threshold=1000,
+    maxsize=1024,
+    serializer="pickle",
+    compress=False,
+):
+    """
+    Cache a function's results in an append-only log at cache_file.
+
+    A log can only be read with the serializer and compress settings it was
+    written with (e.g. a compress=True log cannot be read with compress=False);
+    they are recorded in the file's header, and opening the file with
+    different ones raises ValueError on the first call.
+    """
+
+    if serializer not in _SERIALIZERS:
+        raise ValueError(f"Unsupported serializer: {serializer}")
+    if serializer == "msgpack" and msgpack is None:
+        raise ImportError("serializer='msgpack' requires the 'msgpack' package: pip install msgpack")
+    if compress and zstd is None:
+        raise ImportError("compress=True requires the 'zstandard' package: pip install zstandard")
+    serializer = _SERIALIZERS[serializer]
+    if compress:
+        serializer = _ZstdSerializer(serializer)
 
     def decorator(func):
+        lru = OrderedDict()
+        lru_lock = threading.Lock()
+        file_lock = _get_file_lock(cache_file)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
 
-            cache_key = (args, tuple(sorted(kwargs.items())))
+            # Calls without kwargs are the common case; skip the sort for them.
+            cache_key = _make_key((args, tuple(sorted(kwargs.items())) if kwargs else ()))
 
-            if os.path.exists(cache_file):
-                with open(cache_file, 'rb') as f:
-                    try:
-                        cache = pickle.load(f)
-                    except (EOFError, pickle.UnpicklingError):
-                        cache = {}
-            else:
-                cache = {}
+            with lru_lock:
+                if cache_key in lru:
+                    lru.move_to_end(cache_key)
+                    print(f"Load cache：{func.__name__}")
+                    return lru[cache_key]
 
-            if cache_key in cache:
+            with file_lock:
+                result = _lookup(cache_file, cache_key, serializer, compact_threshold)
+            if result is not _MISSING:
                 print(f"Load cache：{func.__name__}")
-                return cache[cache_key]
-
-
-            print(f"Sava cache：{func.__name__}")
-            result = func(*args, **kwargs)
+            else:
+                print(f"Sava cache：{func.__name__}")
+                result = func(*args, **kwargs)
+                with file_lock:
+                    _append(cache_file, cache_key, result, serializer, compact_threshold)
 
- 
-            cache[cache_key] = result
-            with open(cache_file, 'wb') as f:
-                pickle.dump(cache, f)
+            with lru_lock:
+                lru[cache_key] = result
+                if len(lru) > maxsize:
+                    lru.popitem(last=False)
 
             return result
         return wrapper
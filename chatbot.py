@@ -1,3 +1,8 @@
+import collections
+import concurrent.futures
+import hashlib
+import heapq
+import itertools
 import threading
 import time
 import sys
@@ -17,7 +22,16 @@ class Chatbot:
         self.model = model
         self.api_states = []
         self._lock = threading.Lock()
-        self._current_api_index = 0
+        # Round-robin queue of the API states that are currently available, and
+        # a heap of (ready_time, seq, api_info) for those cooling down. Both are
+        # only mutated on state transitions, so picking a client is O(1).
+        self._available = collections.deque()
+        self._cooling = []
+        self._cooling_seq = itertools.count()
+        # Futures for requests currently being served, keyed by prompt hash,
+        # so identical concurrent prompts share a single API round-trip.
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
         self.cooldown_period = 300  # Default cooldown period in seconds (5 minutes)
         self.max_attempts_per_prompt = 5
 
@@ -34,6 +48,9 @@ class Chatbot:
             )
             sys.exit(1)
 
+        # With a single API there is nothing to rotate, so the hot path can skip the lock.
+        self._single_client = self.api_states[0] if len(self.api_states) == 1 else None
+
     def _initialize_clients(self, llm_config_dict: dict):
         """
         Initializes API clients based on the YAML config dictionary.
@@ -71,44 +88,94 @@ class Chatbot:
                     f"Failed to initialize API client for key {i} of {self.model}: {e}"
                 )
 
+        # Index the API states by client identity so failure bookkeeping is O(1).
+        self._client_index = {id(info["client"]): info for info in self.api_states}
+        self._available = collections.deque(self.api_states)
+
     def _get_next_available_client(self):
         """
         Thread-safely cycles through and returns the next available API client.
         """
-        with self._lock:
-            num_apis = len(self.api_states)
-            if num_apis == 0:
-                return None, None, None
+        single = self._single_client
+        if single is not None and single["is_available"]:
+            return single["client"], single["model_name"], single["name"]
 
-            for _ in range(num_apis):
-                api_info = self.api_states[self._current_api_index]
+        with self._lock:
+            now = time.time()
+            while self._cooling and self._cooling[0][0] <= now:
+                _, _, api_info = heapq.heappop(self._cooling)
+                if id(api_info["client"]) not in self._client_index:
+                    continue  # Permanently disabled while cooling down.
+                api_info["is_available"] = True
+                api_info["last_failure_time"] = 0
+                self._available.append(api_info)
+                logger.info(
+                    f"API '{api_info['name']}' cooldown period over. Resetting to available."
+                )
 
-                if not api_info["is_available"] and (
-                    time.time() - api_info["last_failure_time"]
-                    > api_info.get("cooldown_until", self.cooldown_period)
-                ):
-                    api_info["is_available"] = True
-                    api_info["last_failure_time"] = 0
-                    logger.info(
-                        f"API '{api_info['name']}' cooldown period over. Resetting to available."
-                    )
+            if not self._available:
+                return None, None, None
 
-                if api_info["is_available"]:
-                    temp_client = api_info["client"]
-                    temp_model_name = api_info["model_name"]
-                    temp_api_name = api_info["name"]
-                    self._current_api_index = (self._current_api_index + 1) % num_apis
-                    return temp_client, temp_model_name, temp_api_name
+            api_info = self._available[0]
+            self._available.rotate(-1)
+            return api_info["client"], api_info["model_name"], api_info["name"]
 
-                self._current_api_index = (self._current_api_index + 1) % num_apis
+    def _mark_unavailable(self, api_info: dict, delay: float = None):
+        """
+        Moves an API state from the available queue to the cooldown heap.
+        Must be called with self._lock held.
+        """
+        if not api_info["is_available"]:
+            return  # Already cooling down, e.g. after a concurrent failure.
+        if delay is None:
+            delay = api_info.get("cooldown_until", self.cooldown_period)
 
-            return None, None, None
+        now = time.time()
+        api_info["is_available"] = False
+        api_info["last_failure_time"] = now
+        api_info["cooldown_until"] = delay
+        self._available.remove(api_info)
+        heapq.heappush(self._cooling, (now + delay, next(self._cooling_seq), api_info))
 
     def call(
         self, prompt: str, system_prompt: str = "You are a helpful assistant."
     ) -> str:
         """
         Makes a robust API call with retry logic and error handling.
+        Concurrent calls with the same model, system prompt and prompt are
+        deduplicated: only the first one hits the API, the others wait for
+        and share its result. For persistence across processes, combine with
+        the cache decorator from cache.py.
+        """
+        key = hashlib.blake2b(
+            f"{self.model}|{system_prompt}|{prompt}".encode(), digest_size=16
+        ).hexdigest()
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight[key] = concurrent.futures.Future()
+
+        if not is_owner:
+            logger.info("An identical request is already in flight, waiting for its result.")
+            return future.result()
+
+        try:
+            result = self._call_api(prompt, system_prompt)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _call_api(self, prompt: str, system_prompt: str) -> str:
+        """
+        Sends the prompt to the next available API, rotating through clients on failure.
         """
         messages = []
         if system_prompt:
@@ -140,30 +207,28 @@ class Chatbot:
             except RateLimitError as e:
                 logger.warning(f"API '{api_name}' reached rate limit: {e}")
                 with self._lock:
-                    for api_info in self.api_states:
-                        if api_info["client"] == client:
-                            retry_after = e.response.headers.get("retry-after")
-                            delay = (
-                                int(retry_after)
-                                if retry_after
-                                else self.cooldown_period
-                            )
-                            api_info["is_available"] = False
-                            api_info["last_failure_time"] = time.time()
-                            api_info["cooldown_until"] = delay
-                            logger.info(
-                                f"API '{api_name}' has been marked as unavailable, cooling down for {delay} seconds."
-                            )
-                            break
+                    api_info = self._client_index.get(id(client))
+                    if api_info is not None:
+                        retry_after = e.response.headers.get("retry-after")
+                        delay = int(retry_after) if retry_after else self.cooldown_period
+                        self._mark_unavailable(api_info, delay)
+                        logger.info(
+                            f"API '{api_name}' has been marked as unavailable, cooling down for {delay} seconds."
+                        )
 
             except APIStatusError as e:
                 logger.error(
                     f"API '{api_name}' returned a permanent status error: {e}. This API will be permanently disabled."
                 )
                 with self._lock:
+                    api_info = self._client_index.pop(id(client), None)
+                    if api_info is not None and api_info["is_available"]:
+                        self._available.remove(api_info)
                     self.api_states = [
-                        api for api in self.api_states if api["client"] != client
+                        api for api in self.api_states if api["client"] is not client
                     ]
+                    if self._single_client is not None and self._single_client["client"] is client:
+                        self._single_client = None
                     if not self.api_states:
                         logger.error("All API clients have been permanently disabled.")
                         break
@@ -171,26 +236,22 @@ class Chatbot:
             except APIError as e:
                 logger.error(f"API '{api_name}' returned an APIError: {e}")
                 with self._lock:
-                    for api_info in self.api_states:
-                        if api_info["client"] == client:
-                            api_info["is_available"] = False
-                            api_info["last_failure_time"] = time.time()
-                            logger.info(
-                                f"API '{api_name}' has been marked as unavailable, cooling down."
-                            )
-                            break
+                    api_info = self._client_index.get(id(client))
+                    if api_info is not None:
+                        self._mark_unavailable(api_info)
+                        logger.info(
+                            f"API '{api_name}' has been marked as unavailable, cooling down."
+                        )
 
             except Exception as e:
                 logger.error(f"API '{api_name}' failed with an unknown error: {e}")
                 with self._lock:
-                    for api_info in self.api_states:
-                        if api_info["client"] == client:
-                            api_info["is_available"] = False
-                            api_info["last_failure_time"] = time.time()
-                            logger.info(
-                                f"API '{api_name}' has been marked as unavailable, cooling down."
-                            )
-                            break
+                    api_info = self._client_index.get(id(client))
+                    if api_info is not None:
+                        self._mark_unavailable(api_info)
+                        logger.info(
+                            f"API '{api_name}' has been marked as unavailable, cooling down."
+                        )
 
         logger.error(
             f"Error: All available APIs failed after {self.max_attempts_per_prompt} attempts."
@@ -1,6 +1,7 @@
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, TextIO, Union
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, field_validator
@@ -11,6 +12,11 @@ import configparser
 from dotenv import load_dotenv
 from loguru import logger
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader
+
 
 class ConfigManager(BaseSettings):
     """
@@ -66,28 +72,7 @@ class ConfigManager(BaseSettings):
             return cls(**kwargs)
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                if path.suffix.lower() in [".yml", ".yaml"]:
-                    data = yaml.safe_load(f) or {}
-                elif path.suffix.lower() == ".json":
-                    data = json.load(f)
-                elif path.suffix.lower() == ".toml":
-                    data = toml.load(f)
-                elif path.suffix.lower() in [".ini", ".cfg"]:
-                    config = configparser.ConfigParser()
-                    config.read_file(f)
-                    data = {
-                        k: v
-                        for section in config.sections()
-                        for k, v in config.items(section)
-                    }
-                else:
-                    logger.error(
-                        f"Unsupported configuration file format: {path.suffix}"
-                    )
-                    raise ValueError(
-                        f"Unsupported configuration file format: {path.suffix}"
-                    )
+            data = _load_config_file(path)
 
             # Merge file data with any additional kwargs
             data.update(kwargs)
@@ -136,6 +121,51 @@ class ConfigManager(BaseSettings):
         return v
 
 
+def _load_yaml(f: TextIO) -> Dict[str, Any]:
+    return yaml.load(f, Loader=SafeLoader) or {}
+
+
+def _load_ini(f: TextIO) -> Dict[str, Any]:
+    config = configparser.ConfigParser()
+    config.read_file(f)
+    return {k: v for section in config.sections() for k, v in config.items(section)}
+
+
+# Parser for each supported configuration file suffix.
+_PARSERS: Dict[str, Callable[[TextIO], Dict[str, Any]]] = {
+    ".yml": _load_yaml,
+    ".yaml": _load_yaml,
+    ".json": json.load,
+    ".toml": toml.load,
+    ".ini": _load_ini,
+    ".cfg": _load_ini,
+}
+
+
+@lru_cache(maxsize=32)
+def _parse_config_file(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a configuration file (YAML, JSON, TOML, INI) into a dictionary.
+
+    Results are cached per (path, mtime), so repeated loads of an unchanged
+    file skip both the read and the parse. The cached dictionary is shared;
+    use _load_config_file to get a copy that is safe to modify.
+    """
+    path = Path(path_str)
+    parser = _PARSERS.get(path.suffix.lower())
+    if parser is None:
+        logger.error(f"Unsupported configuration file format: {path.suffix}")
+        raise ValueError(f"Unsupported configuration file format: {path.suffix}")
+
+    with open(path, "r", encoding="utf-8") as f:
+        return parser(f)
+
+
+def _load_config_file(path: Path) -> Dict[str, Any]:
+    """Load a configuration file, reusing the cached parse while it is unchanged."""
+    return dict(_parse_config_file(str(path.resolve()), path.stat().st_mtime_ns))
+
+
 def get_config(
     config_file_path: Optional[Union[str, Path]] = None,
     dotenv_path: Optional[Union[str, Path]] = None,
@@ -167,28 +197,7 @@ def get_config(
         try:
             file_path = Path(config_file_path)
             if file_path.exists():
-                with open(file_path, "r", encoding="utf-8") as f:
-                    if file_path.suffix.lower() in [".yml", ".yaml"]:
-                        file_data = yaml.safe_load(f) or {}
-                    elif file_path.suffix.lower() == ".json":
-                        file_data = json.load(f)
-                    elif file_path.suffix.lower() == ".toml":
-                        file_data = toml.load(f)
-                    elif file_path.suffix.lower() in [".ini", ".cfg"]:
-                        config = configparser.ConfigParser()
-                        config.read_file(f)
-                        file_data = {
-                            k: v
-                            for section in config.sections()
-                            for k, v in config.items(section)
-                        }
-                    else:
-                        logger.error(
-                            f"Unsupported configuration file format: {file_path.suffix}"
-                        )
-                        raise ValueError(
-                            f"Unsupported configuration file format: {file_path.suffix}"
-                        )
+                file_data = _load_config_file(file_path)
                 config_data.update(file_data)
             else:
                 logger.warning(f"Configuration file {config_file_path} does not exist.")
@@ -1,9 +1,29 @@
 import csv
 import json
+import operator
+import re
 import yaml
 from abc import ABC, abstractmethod
 from loguru import logger
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, Iterable, List, Sequence, Union
+
+try:
+    import orjson
+except ImportError:  # Optional, falls back to the stdlib json module.
+    orjson = None
+
+# orjson reads integers outside the 64-bit range as floats instead of failing.
+# Files with a run of 19+ digits might hold one and are read with json.
+_LONG_DIGITS = re.compile(rb"\d{19}")
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+
+# Large write buffer so CSV rows are flushed in few big write() calls.
+_CSV_BUFFER_SIZE = 1 << 20
 
 
 class FileManager(ABC):
@@ -23,6 +43,16 @@ class FileManager(ABC):
 class JsonManager(FileManager):
 
     def read(self, filepath: str) -> Union[Dict, List]:
+        if orjson is not None:
+            with open(filepath, "rb") as f:
+                raw = f.read()
+            if not _LONG_DIGITS.search(raw):
+                try:
+                    return orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    pass  # e.g. NaN or Infinity, which json accepts
+            return json.loads(raw.decode("utf-8"))
+
         with open(filepath, "r", encoding="utf-8") as f:
             return json.load(f)
 
@@ -33,6 +63,8 @@ class JsonManager(FileManager):
                 "JSON files are typically overwritten (mode='w'). Using append or other modes may corrupt the file."
             )
 
+        # Always written with json: orjson turns NaN/Infinity into null, so
+        # its output would not read back as the same data.
         with open(filepath, mode, encoding="utf-8") as f:
             json.dump(data, f, indent=indent)
         self._log_write_success(filepath, mode)
@@ -42,7 +74,7 @@ class YamlManager(FileManager):
 
     def read(self, filepath: str) -> Union[Dict, List]:
         with open(filepath, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=SafeLoader)
 
     def write(self, filepath: str, data: Any, mode: str = "w"):
 
@@ -52,7 +84,7 @@ class YamlManager(FileManager):
             )
 
         with open(filepath, mode, encoding="utf-8") as f:
-            yaml.safe_dump(data, f)
+            yaml.dump(data, f, Dumper=SafeDumper)
         self._log_write_success(filepath, mode)
 
 
@@ -63,23 +95,101 @@ class CsvManager(FileManager):
             reader = csv.DictReader(f)
             return [row for row in reader]
 
-    def write(self, filepath: str, data: List[Dict], mode: str = "w"):
-        if not data:
+    def write(
+        self,
+        filepath: str,
+        data: Iterable[Union[Dict, Sequence]],
+        mode: str = "w",
+    ):
+        error = "Data for CSV must be a list of dictionaries or a list of tuples."
+        # Mappings and strings are iterable too, but iterating them yields
+        # keys or characters rather than rows.
+        if isinstance(data, (dict, str, bytes)):
+            raise TypeError(error)
+        if isinstance(data, list) and data:
+            if not (
+                all(isinstance(d, dict) for d in data)
+                or all(isinstance(d, (list, tuple)) for d in data)
+            ):
+                raise TypeError(error)
+
+        # Peek at the first row so generators can be streamed without
+        # materializing them.
+        rows = iter(data)
+        first = next(rows, None)
+        if first is None:
             logger.warning(f"Data is empty. Nothing will be written to '{filepath}'.")
             return
-
-        if not isinstance(data, list) or not all(isinstance(d, dict) for d in data):
-            raise TypeError("Data for CSV must be a list of dictionaries.")
-
-        fieldnames = data[0].keys()
-
-        with open(filepath, mode, newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            if mode == "w":  # 只有在写入新文件时才写入表头
-                writer.writeheader()
-            writer.writerows(data)
+        if not isinstance(first, (dict, list, tuple)):
+            raise TypeError(error)
+
+        with open(
+            filepath, mode, newline="", encoding="utf-8", buffering=_CSV_BUFFER_SIZE
+        ) as f:
+            writer = csv.writer(f)
+            if isinstance(first, dict):
+                fieldnames = list(first.keys())
+                if mode == "w":  # 只有在写入新文件时才写入表头
+                    writer.writerow(fieldnames)
+                convert = self._dict_row_converter(fieldnames, error)
+                writer.writerow(convert(first))
+                writer.writerows(map(convert, rows))
+            else:
+                # Tuple rows are written as-is; include a header row yourself if needed.
+                writer.writerow(first)
+                if isinstance(data, list):
+                    writer.writerows(rows)
+                else:
+                    writer.writerows(map(self._sequence_row_checker(error), rows))
         self._log_write_success(filepath, mode)
 
+    @staticmethod
+    def _dict_row_converter(fieldnames: List[str], error: str):
+        """
+        Build a function turning dict rows into value tuples like csv.DictWriter.
+
+        Rows with exactly the header's keys are pulled out in C by itemgetter
+        instead of DictWriter's per-row Python lookups. Any other row takes
+        the DictWriter path: missing fields are written as "" and unknown
+        fields raise ValueError.
+        """
+        count = len(fieldnames)
+        if count == 1:
+            field = fieldnames[0]
+            getter = lambda row: (row[field],)
+        else:
+            getter = operator.itemgetter(*fieldnames)
+        known = frozenset(fieldnames)
+
+        def convert(row):
+            if not isinstance(row, dict):
+                raise TypeError(error)
+            if len(row) == count:
+                try:
+                    return getter(row)
+                except KeyError:
+                    pass
+            extra = row.keys() - known
+            if extra:
+                raise ValueError(
+                    "dict contains fields not in fieldnames: "
+                    + ", ".join([repr(x) for x in extra])
+                )
+            return [row.get(key, "") for key in fieldnames]
+
+        return convert
+
+    @staticmethod
+    def _sequence_row_checker(error: str):
+        """Build a function rejecting streamed rows that are not lists or tuples."""
+
+        def check(row):
+            if not isinstance(row, (list, tuple)):
+                raise TypeError(error)
+            return row
+
+        return check
+
 
 class TxtManager(FileManager):
 
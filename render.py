@@ -1,8 +1,29 @@
 from pathlib import Path
 from typing import Dict, Optional, Any
-from jinja2 import Environment, FileSystemLoader, TemplateError
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    TemplateError,
+)
 from loguru import logger
 
+# 按模板目录缓存 Jinja2 环境。环境自带的模板缓存会在模板文件修改后自动重新加载，
+# 字节码缓存则让编译结果可以跨进程复用。
+_ENV_CACHE: Dict[str, Environment] = {}
+
+
+def _get_environment(template_dir: str) -> Environment:
+    env = _ENV_CACHE.get(template_dir)
+    if env is None:
+        env = Environment(
+            loader=FileSystemLoader(template_dir),
+            cache_size=400,
+            bytecode_cache=FileSystemBytecodeCache(),
+        )
+        _ENV_CACHE[template_dir] = env
+    return env
+
 
 def render_template(
     template_path: str, data: Dict[str, Any], output_path: Optional[str] = None
@@ -33,8 +54,8 @@ def render_template(
         template_dir = str(tpl_path.parent)
         template_file = tpl_path.name
 
-        # 创建 Jinja2 环境
-        env = Environment(loader=FileSystemLoader(template_dir))
+        # 获取（缓存的）Jinja2 环境
+        env = _get_environment(template_dir)
 
         # 加载并渲染模板
         template = env.get_template(template_file)
@@ -45,8 +66,7 @@ def render_template(
             out_path = Path(output_path).resolve()
             # 确保输出目录存在
             out_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(out_path, "w", encoding="utf-8") as f:
-                f.write(rendered_content)
+            out_path.write_text(rendered_content, encoding="utf-8")
             logger.info(f"Template successfully rendered and saved to: {out_path}")
             return None
         else:
@@ -20,7 +20,7 @@
 # logger.add("app.log")
 
 # def main():
-#     config = yaml.safe_load(CONFIG_YAML)
+#     config = yaml.load(CONFIG_YAML, Loader=SafeLoader)
 #     print(config)
 #     ds=chatbot("deepseek_v3",config.get("llm"))
 #     response=ds.call("hello")
@@ -39,6 +39,11 @@ from file_manager import get_file_manager
 from chatbot import Chatbot
 from loguru import logger
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 logger.add("app.log")
 
 # Configuration for the LLM APIs.
@@ -76,7 +81,7 @@ def main():
     logger.info("主程序开始运行。")
 
     # Load the configuration from the YAML string.
-    config = yaml.safe_load(CONFIG_YAML)
+    config = yaml.load(CONFIG_YAML, Loader=SafeLoader)
     
     # Initialize the chatbot instance with the configuration.
     llm_bot = Chatbot("deepseek_v3",config.get("llm"))
@@ -0,0 +1,206 @@
+import sys
+import os
+
+# Add the parent directory to the path so we can import cache
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pickle
+import tempfile
+import threading
+import pytest
+import cache as cache_module
+from cache import cache
+
+
+def _new_process():
+    """Forget every loaded cache file, as if the interpreter was restarted."""
+    cache_module._MEMCACHE.clear()
+    cache_module._FRAME_COUNTS.clear()
+    cache_module._FORMATS.clear()
+
+
+def _counting(cache_file, **options):
+    """Return a cached doubling function and the list of arguments it was run with."""
+    calls = []
+
+    @cache(cache_file, **options)
+    def double(x):
+        calls.append(x)
+        return {"value": x * 2}
+
+    return double, calls
+
+
+@pytest.mark.parametrize("serializer", ["pickle", "msgpack"])
+@pytest.mark.parametrize("compress", [False, True])
+def test_cache_reload_in_new_process(serializer, compress):
+    """Test that results survive a restart for every serializer/compress combination."""
+    if serializer == "msgpack":
+        pytest.importorskip("msgpack")
+    if compress:
+        pytest.importorskip("zstandard")
+    options = {"serializer": serializer, "compress": compress}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_file = os.path.join(tmp_dir, "cache.log")
+        double, calls = _counting(cache_file, **options)
+        assert [double(x) for x in (1, 2, 3)] == [{"value": 2}, {"value": 4}, {"value": 6}]
+        assert calls == [1, 2, 3]
+
+        _new_process()
+        double, calls = _counting(cache_file, **options)
+        assert [double(x) for x in (3, 2, 1)] == [{"value": 6}, {"value": 4}, {"value": 2}]
+        assert double(4) == {"value": 8}
+        assert calls == [4]
+    print("test_cache_reload_in_new_process passed")
+
+
+def test_cache_migrates_legacy_dict_file():
+    """Test that a cache file pickled as one dict is still served, then rewritten."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_file = os.path.join(tmp_dir, "cache.pkl")
+        with open(cache_file, "wb") as f:
+            pickle.dump({((10,), ()): {"value": 20}}, f)
+
+        for _ in range(2):
+            _new_process()
+            double, calls = _counting(cache_file)
+            assert double(10) == {"value": 20}
+            assert calls == []
+            with open(cache_file, "rb") as f:
+                assert f.read().startswith(cache_module._HEADER_MAGIC)
+    print("test_cache_migrates_legacy_dict_file passed")
+
+
+def test_cache_drops_truncated_trailing_frame():
+    """Test that an interrupted write only loses the frame it was writing."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_file = os.path.join(tmp_dir, "cache.log")
+        double, _ = _counting(cache_file)
+        double(1)
+        double(2)
+        with open(cache_file, "r+b") as f:
+            f.truncate(os.path.getsize(cache_file) - 3)
+
+        for expected_calls in ([2], []):
+            _new_process()
+            double, calls = _counting(cache_file)
+            assert double(1) == {"value": 2}
+            assert double(2) == {"value": 4}
+            assert calls == expected_calls
+    print("test_cache_drops_truncated_trailing_frame passed")
+
+
+def test_cache_unserializable_result_leaves_log_intact():
+    """Test that a result that cannot be serialized is not half-written to the log."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_file = os.path.join(tmp_dir, "cache.log")
+        double, _ = _counting(cache_file)
+        double(1)
+        size = os.path.getsize(cache_file)
+
+        @cache(cache_file)
+        def unpicklable(x):
+            return [b"x" * 200000, threading.Lock()]
+
+        with pytest.raises(TypeError):
+            unpicklable(2)
+        assert os.path.getsize(cache_file) == size
+        assert len(cache_module._MEMCACHE[cache_file]) == 1
+
+        _new_process()
+        double, calls = _counting(cache_file)
+        assert double(1) == {"value": 2}
+        assert calls == []
+    print("test_cache_unserializable_result_leaves_log_intact passed")
+
+
+def test_cache_compaction_threshold():
+    """Test that stale frames are dropped once they exceed compact_threshold."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_file = os.path.join(tmp_dir, "cache.log")
+        double, _ = _counting(cache_file, compact_threshold=2)
+        double(1)
+
+        # Rewrite the same key, as two threads missing on it at once would
+        serializer = cache_module._SERIALIZERS["pickle"]
+        cache_key = cache_module._make_key(((1,), ()))
+        for n in range(3):
+            cache_module._append(cache_file, cache_key, {"value": n}, serializer, 2)
+        assert cache_module._FRAME_COUNTS[cache_file] == 1
+
+        with open(cache_file, "rb") as f:
+            cache_module._read_format(cache_file, f, serializer)
+            entries = list(cache_module._iter_entries(f, serializer))
+        assert [result for _, _, result in entries] == [{"value": 2}]
+
+        _new_process()
+        double, calls = _counting(cache_file, compact_threshold=2)
+        assert double(1) == {"value": 2}
+        assert calls == []
+    print("test_cache_compaction_threshold passed")
+
+
+def test_cache_equal_arguments_share_entry():
+    """Test that equal arguments hit the same entry regardless of identity."""
+    calls = []
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+
+        @cache(os.path.join(tmp_dir, "cache.pkl"))
+        def echo(*args, **kwargs):
+            calls.append(args)
+            return len(calls)
+
+        s = "prompt " * 4
+        copy_of_s = "".join(["prompt "] * 4)
+        assert s is not copy_of_s
+
+        assert echo(s, s) == 1
+        assert echo(s, copy_of_s) == 1
+        assert echo(1) == 2
+        assert echo(1.0) == 2
+        assert echo(True) == 2
+        assert echo(frozenset("abc"), x=1) == 3
+        assert echo(frozenset("cba"), x=1.0) == 3
+        assert echo(1.5) == 4
+    print("test_cache_equal_arguments_share_entry passed")
+
+
+def test_cache_rejects_file_of_other_serializer():
+    """Test that a log is only read with the serializer that wrote it."""
+    pytest.importorskip("msgpack")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_file = os.path.join(tmp_dir, "cache.pkl")
+        assert cache(cache_file)(lambda x: x * 2)(21) == 42
+
+        with pytest.raises(ValueError, match="pickle"):
+            cache(cache_file, serializer="msgpack")(lambda x: x * 2)(21)
+    print("test_cache_rejects_file_of_other_serializer passed")
+
+
+def test_cache_rejects_compression_mismatch():
+    """Test that a compressed log is never read back as plain frames."""
+    pytest.importorskip("zstandard")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_file = os.path.join(tmp_dir, "cache.pkl")
+        assert cache(cache_file, compress=True)(lambda x: x * 2)(21) == 42
+
+        # Both within this process and after a restart
+        for _ in range(2):
+            with pytest.raises(ValueError, match="zstd"):
+                cache(cache_file)(lambda x: x * 2)(21)
+            cache_module._MEMCACHE.clear()
+    print("test_cache_rejects_compression_mismatch passed")
+
+
+if __name__ == "__main__":
+    test_cache_migrates_legacy_dict_file()
+    test_cache_drops_truncated_trailing_frame()
+    test_cache_unserializable_result_leaves_log_intact()
+    test_cache_compaction_threshold()
+    test_cache_equal_arguments_share_entry()
+    test_cache_rejects_file_of_other_serializer()
+    test_cache_rejects_compression_mismatch()
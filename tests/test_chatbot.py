@@ -0,0 +1,136 @@
+import sys
+import os
+
+# Add the parent directory to the path so we can import chatbot
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import threading
+import time
+from types import SimpleNamespace
+import pytest
+from openai import APIStatusError, RateLimitError
+import chatbot
+from chatbot import Chatbot
+
+
+def _response(status_code, headers=None):
+    """Stand in for the HTTP response attached to openai's status errors."""
+    return SimpleNamespace(status_code=status_code, headers=headers or {}, request=None)
+
+
+class FakeClient:
+    """Replaces openai.OpenAI; each key's behaviour is set through `mode`."""
+
+    def __init__(self, base_url=None, api_key=None):
+        self.api_key = api_key
+        self.mode = "ok"
+        self.calls = 0
+        self.before_call = None
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, model, messages, temperature, max_tokens):
+        self.calls += 1
+        if self.before_call is not None:
+            self.before_call()
+        if self.mode == "rate_limit":
+            raise RateLimitError(
+                "rate limited", response=_response(429, {"retry-after": "100"}), body=None
+            )
+        if self.mode == "forbidden":
+            raise APIStatusError("forbidden", response=_response(403), body=None)
+        content = f" {self.api_key}: {messages[-1]['content']} "
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+        )
+
+
+@pytest.fixture
+def make_bot(monkeypatch):
+    """Build a Chatbot over FakeClients and return it with the clients by key."""
+    monkeypatch.setattr(chatbot, "OpenAI", FakeClient)
+
+    def make(*api_keys):
+        config = {"m": {"base_url": "http://llm", "model": "mm", "api_keys": list(api_keys)}}
+        bot = Chatbot("m", config)
+        return bot, {info["client"].api_key: info["client"] for info in bot.api_states}
+
+    return make
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze time.time() at a value the test can move forward."""
+    now = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return now
+
+
+def test_chatbot_readmits_rate_limited_client(make_bot, clock):
+    """Test that a rate-limited client is skipped until its retry-after has passed."""
+    bot, clients = make_bot("a", "b")
+    clients["a"].mode = "rate_limit"
+
+    assert bot.call("1") == "b: 1"
+    clients["a"].mode = "ok"
+    clock[0] += 99
+    assert [bot.call(str(n)) for n in range(2, 5)] == ["b: 2", "b: 3", "b: 4"]
+    assert clients["a"].calls == 1
+
+    clock[0] += 1
+    assert {bot.call(n).split(":")[0] for n in ("5", "6")} == {"a", "b"}
+    assert clients["a"].calls == 2
+    print("test_chatbot_readmits_rate_limited_client passed")
+
+
+def test_chatbot_removes_permanently_failed_client(make_bot, clock):
+    """Test that a client returning a status error is never used again."""
+    bot, clients = make_bot("a", "b", "c")
+    clients["a"].mode = "forbidden"
+
+    # A concurrent request rate-limits "b" while its own request is still
+    # running, so the permanent failure arrives while it is cooling down.
+    def rate_limited_elsewhere():
+        with bot._lock:
+            bot._mark_unavailable(bot._client_index[id(clients["b"])])
+
+    clients["b"].mode = "forbidden"
+    clients["b"].before_call = rate_limited_elsewhere
+
+    assert bot.call("1") == "c: 1"
+    assert [info["client"] for info in bot.api_states] == [clients["c"]]
+
+    clock[0] += bot.cooldown_period
+    assert [bot.call(str(n)) for n in range(2, 5)] == ["c: 2", "c: 3", "c: 4"]
+    assert clients["a"].calls == clients["b"].calls == 1
+    assert list(bot._available) == bot.api_states
+    print("test_chatbot_removes_permanently_failed_client passed")
+
+
+def test_chatbot_deduplicates_concurrent_prompts(make_bot):
+    """Test that identical prompts sent concurrently share one API call."""
+    bot, clients = make_bot("a", "b")
+    release = threading.Event()
+    for client in clients.values():
+        client.before_call = release.wait
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(bot.call("same")))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    # Give every thread time to find the request in flight before it completes.
+    time.sleep(0.2)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert sum(client.calls for client in clients.values()) == 1
+    assert len(results) == 5 and len(set(results)) == 1
+    assert bot._inflight == {}
+    print("test_chatbot_deduplicates_concurrent_prompts passed")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-q"])
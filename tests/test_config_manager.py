@@ -7,6 +7,11 @@ import configparser
 from pathlib import Path
 from config_manager import ConfigManager, get_config
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
 
 def test_config_manager_defaults():
     """Test loading configuration with defaults only."""
@@ -60,7 +65,7 @@ def test_get_config_with_yaml_file():
     }
     
     with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        yaml.dump(yaml_data, f)
+        yaml.dump(yaml_data, f, Dumper=SafeDumper)
         yaml_file_path = f.name
     
     try:
@@ -159,6 +164,28 @@ def test_get_config_with_ini_file():
         os.unlink(ini_file_path)
 
 
+def test_get_config_reloads_modified_file():
+    """Test that a cached config file is re-parsed once it changes on disk."""
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+        yaml.dump({"app_name": "FirstApp"}, f, Dumper=SafeDumper)
+        yaml_file_path = f.name
+
+    try:
+        assert get_config(config_file_path=yaml_file_path).app_name == "FirstApp"
+        assert ConfigManager.load_from_file(yaml_file_path).app_name == "FirstApp"
+
+        with open(yaml_file_path, 'w') as f:
+            yaml.dump({"app_name": "SecondApp"}, f, Dumper=SafeDumper)
+        # Make sure the mtime moves even on filesystems with coarse timestamps
+        stat = os.stat(yaml_file_path)
+        os.utime(yaml_file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert get_config(config_file_path=yaml_file_path).app_name == "SecondApp"
+        print("test_get_config_reloads_modified_file passed")
+    finally:
+        os.unlink(yaml_file_path)
+
+
 def test_get_config_with_env_and_file(monkeypatch):
     """Test get_config with both environment variables and a file, where env vars take precedence."""
     # Set environment variables
@@ -174,7 +201,7 @@ def test_get_config_with_env_and_file(monkeypatch):
     }
     
     with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        yaml.dump(yaml_data, f)
+        yaml.dump(yaml_data, f, Dumper=SafeDumper)
         yaml_file_path = f.name
     
     try:
@@ -207,7 +234,7 @@ def test_get_config_with_kwargs_override():
     }
     
     with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        yaml.dump(yaml_data, f)
+        yaml.dump(yaml_data, f, Dumper=SafeDumper)
         yaml_file_path = f.name
     
     try:
@@ -0,0 +1,80 @@
+import sys
+import os
+
+# Add the parent directory to the path so we can import file_manager
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import math
+import tempfile
+import pytest
+from file_manager import CsvManager, JsonManager
+
+
+def test_json_manager_round_trip():
+    """Test that JsonManager reads back exactly what it wrote."""
+    data = {
+        "nan": float("nan"),
+        "inf": float("inf"),
+        "big": 2**70,
+        "negative_big": -(2**64),
+        "float": 0.1,
+        "text": "héllo",
+        "items": [1, None, True],
+    }
+    manager = JsonManager()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for indent in (None, 2, 4):
+            path = os.path.join(tmp_dir, f"data_{indent}.json")
+            manager.write(path, data, indent=indent)
+            result = manager.read(path)
+
+            assert math.isnan(result.pop("nan"))
+            assert result == {k: v for k, v in data.items() if k != "nan"}
+            assert type(result["big"]) is int
+    print("test_json_manager_round_trip passed")
+
+
+def test_csv_manager_rejects_non_row_data():
+    """Test that CsvManager.write only accepts rows of dictionaries or tuples."""
+    manager = CsvManager()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "data.csv")
+        for data in ({"a": 1}, "abc", b"abc", (x for x in "abc")):
+            with pytest.raises(TypeError):
+                manager.write(path, data)
+        assert not os.path.exists(path)
+
+        # Streamed rows are checked one by one, like the rows of a list.
+        for data in ([("h1", "h2"), {"x": 1}], [{"x": 1}, ("h1", "h2")]):
+            with pytest.raises(TypeError):
+                manager.write(path, iter(data))
+
+        manager.write(path, ({"name": name, "n": n} for n, name in enumerate("ab")))
+        assert manager.read(path) == [{"name": "a", "n": "0"}, {"name": "b", "n": "1"}]
+    print("test_csv_manager_rejects_non_row_data passed")
+
+
+def test_csv_manager_mismatched_dict_rows():
+    """Test that dict rows whose keys differ from the header behave like csv.DictWriter."""
+    manager = CsvManager()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "data.csv")
+        rows = [{"a": 1, "b": 2}, {"b": 3}, {"b": 4, "a": 5}, {"a": 6, "c": 7}]
+        for data in (rows[:3], iter(rows[:3])):
+            manager.write(path, data)
+            assert manager.read(path) == [
+                {"a": "1", "b": "2"},
+                {"a": "", "b": "3"},
+                {"a": "5", "b": "4"},
+            ]
+
+        for data in (rows, [rows[0], {"a": 6, "c": 7, "d": 8}]):
+            with pytest.raises(ValueError):
+                manager.write(path, data)
+    print("test_csv_manager_mismatched_dict_rows passed")
+
+
+if __name__ == "__main__":
+    test_json_manager_round_trip()
+    test_csv_manager_rejects_non_row_data()
+    test_csv_manager_mismatched_dict_rows()
@@ -0,0 +1,32 @@
+import sys
+import os
+
+# Add the parent directory to the path so we can import timer
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from timer import format_timedelta
+
+
+def test_format_timedelta():
+    """Test format_timedelta output, including rounding up to a full minute."""
+    cases = [
+        (0, "0.0000s"),
+        (0.00005, "0.0001s"),
+        (1.5, "1.5000s"),
+        (59.99996, "60.0000s"),
+        (60, "1m0.0000s"),
+        (3599.99996, "59m60.0000s"),
+        (3725.25, "1h2m5.2500s"),
+        (86400, "1d0.0000s"),
+        (90061.5, "1d1h1m1.5000s"),
+        (-1, "N/A"),
+        (float("inf"), "nans"),
+        (float("nan"), "nans"),
+    ]
+    for seconds, expected in cases:
+        assert format_timedelta(seconds) == expected, seconds
+    print("test_format_timedelta passed")
+
+
+if __name__ == "__main__":
+    test_format_timedelta()
@@ -5,7 +5,10 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 import os
-from universal_config import load_config
+import tempfile
+from collections import defaultdict
+import pytest
+from universal_config import UniversalConfig, load_config
 
 
 def test_universal_config():
@@ -13,8 +16,10 @@ def test_universal_config():
     print("Testing universal configuration loader...")
 
     # Load configuration from file, .env, and kwargs
+    # The example .env file uses unprefixed names, so load every variable
     config = load_config(
         config_file_path="test_config.yaml",
+        env_prefix="",
         app_name="OverriddenAppName",
         new_key="new_value",
     )
@@ -52,6 +57,9 @@ def test_universal_config():
     # Test getting dictionary with prefix
     db_config = config.get_dict("database")
     print(f"Database config: {db_config}")
+    assert db_config["host"] == "localhost"
+    assert config.get_dict("nested.level1") == {"level2": {"value": "nested_value"}}
+    assert config.get_dict("app.name") == {}
 
     # Test getting dictionary without prefix (all config)
     all_config = config.get_dict()
@@ -60,5 +68,252 @@ def test_universal_config():
     print("Universal configuration loader test passed.")
 
 
+def test_load_file_cache_is_not_shared():
+    """Test that changes to one loaded config do not leak into the parse cache."""
+    documents = {
+        ".yaml": "database:\n  host: localhost\n  ports: [1]\n",
+        ".json": '{"database": {"host": "localhost", "ports": [1]}}',
+    }
+    for suffix, text in documents.items():
+        with tempfile.NamedTemporaryFile(mode="w", suffix=suffix, delete=False) as f:
+            f.write(text)
+            file_path = f.name
+
+        try:
+            first = UniversalConfig().load_file(file_path)
+            first.set("database.host", "changed")
+            first.get("database.ports").append(2)
+
+            second = UniversalConfig().load_file(file_path)
+            assert second.get("database.host") == "localhost"
+            assert second.get("database.ports") == [1]
+        finally:
+            os.unlink(file_path)
+    print("test_load_file_cache_is_not_shared passed")
+
+
+def test_load_env_prefix(monkeypatch):
+    """Test that load_env only picks up prefixed variables, stripped and lowercased."""
+    monkeypatch.setenv("MYAPP_DATABASE_HOST", "db.example.com")
+    monkeypatch.setenv("UNRELATED_SETTING", "ignored")
+
+    config = UniversalConfig().load_env(dotenv_path="missing.env")
+    assert config.get("database_host") == "db.example.com"
+    assert not config.exists("UNRELATED_SETTING")
+    assert not config.exists("PATH")
+
+    config = UniversalConfig().load_env(dotenv_path="missing.env", env_prefix="")
+    assert config.get("UNRELATED_SETTING") == "ignored"
+    print("test_load_env_prefix passed")
+
+
+def test_load_file_ini_sections():
+    """Test that INI sections are kept as nested dictionaries."""
+    ini_text = (
+        "[DEFAULT]\n"
+        "timeout = 10\n"
+        "\n"
+        "[database]\n"
+        "; connection settings\n"
+        "Host = localhost\n"
+        "name: mydb\n"
+        "\n"
+        "[cache]\n"
+        "name = redis\n"
+        "servers = a\n"
+        "    b\n"
+    )
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".ini", delete=False) as f:
+        f.write(ini_text)
+        ini_file_path = f.name
+
+    try:
+        config = UniversalConfig().load_file(ini_file_path)
+        assert config.get("database.host") == "localhost"
+        assert config.get("database.name") == "mydb"
+        assert config.get("cache.name") == "redis"
+        assert config.get("cache.servers") == "a\nb"
+        assert config.get("cache.timeout") == "10"
+        assert not config.exists("DEFAULT")
+        print("test_load_file_ini_sections passed")
+    finally:
+        os.unlink(ini_file_path)
+
+
+def test_load_file_ini_indentation_and_interpolation():
+    """Test indented keys, continuation lines and %-interpolation like configparser."""
+    ini_text = (
+        "[DEFAULT]\n"
+        "root = /srv\n"
+        "\n"
+        "[db]\n"
+        "  host = a\n"
+        "  port = 1\n"
+        "  hosts = a\n"
+        "    b\n"
+        "url = %(host)s:5432\n"
+        "usage = 50%%\n"
+        "data = %(root)s/db\n"
+    )
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".ini", delete=False) as f:
+        f.write(ini_text)
+        ini_file_path = f.name
+
+    try:
+        config = UniversalConfig().load_file(ini_file_path)
+        assert config.get("db.host") == "a"
+        assert config.get("db.port") == "1"
+        assert config.get("db.hosts") == "a\nb"
+        assert config.get("db.url") == "a:5432"
+        assert config.get("db.usage") == "50%"
+        assert config.get("db.data") == "/srv/db"
+        print("test_load_file_ini_indentation_and_interpolation passed")
+    finally:
+        os.unlink(ini_file_path)
+
+
+def test_load_file_json_matches_stdlib():
+    """Test that JSON files load exactly as json.load reads them."""
+    documents = [
+        '{"big": 123456789012345678901234567890}',
+        '{"nan": NaN, "text": "\\ud800"}',
+    ]
+    values = {}
+    for json_text in documents:
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            f.write(json_text)
+            json_file_path = f.name
+
+        try:
+            values.update(UniversalConfig().load_file(json_file_path).get_dict())
+        finally:
+            os.unlink(json_file_path)
+
+    assert values["big"] == 123456789012345678901234567890
+    assert type(values["big"]) is int
+    assert values["nan"] != values["nan"]
+    assert values["text"] == "\ud800"
+    print("test_load_file_json_matches_stdlib passed")
+
+
+def test_load_file_yaml_aliases():
+    """Test that YAML aliases stay shared and recursive aliases still load."""
+    yaml_text = "defaults: &d\n  retries: 3\na: *d\nb: *d\nloop: &x [*x]\n"
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+        f.write(yaml_text)
+        yaml_file_path = f.name
+
+    try:
+        config = UniversalConfig().load_file(yaml_file_path)
+        assert config.get("a.retries") == 3
+        assert config.get("a") is config.get("b")
+        loop = config.get("loop")
+        assert loop[0] is loop
+        print("test_load_file_yaml_aliases passed")
+    finally:
+        os.unlink(yaml_file_path)
+
+
+def test_load_file_header():
+    """Test that load_file_header only parses the top of the file."""
+    yaml_text = "app:\n  name: HeaderApp\n  version: 1.2.3\n" + "padding: " + "x" * 8192 + "\n"
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+        f.write(yaml_text)
+        yaml_file_path = f.name
+
+    try:
+        config = UniversalConfig().load_file_header(yaml_file_path, max_bytes=64)
+        assert config.get("app.name") == "HeaderApp"
+        assert config.get("app.version") == "1.2.3"
+        assert not config.exists("padding")
+
+        # A limit that cuts the first line falls back to the full file
+        config = UniversalConfig().load_file_header(yaml_file_path, max_bytes=2)
+        assert config.get("app.version") == "1.2.3"
+        assert config.exists("padding")
+        print("test_load_file_header passed")
+    finally:
+        os.unlink(yaml_file_path)
+
+
+def test_load_file_lazy():
+    """Test that a lazily loaded file gives the same values as a full load."""
+    yaml_text = "version: 1.2.3\ndatabase:\n  host: localhost\n"
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+        f.write(yaml_text)
+        yaml_file_path = f.name
+
+    try:
+        config = UniversalConfig().load_dict({"version": "0.0.1"})
+        config.load_file(yaml_file_path, lazy=True)
+        assert config.get("version") == "1.2.3"
+        assert config.get("database.host") == "localhost"
+        assert config.get_dict() == {"version": "1.2.3", "database": {"host": "localhost"}}
+
+        # Later sources still take precedence over the deferred file
+        config = UniversalConfig().load_file(yaml_file_path, lazy=True)
+        config.load_dict({"version": "2.0.0"})
+        assert config.get("version") == "2.0.0"
+        assert config.get("database.host") == "localhost"
+    finally:
+        os.unlink(yaml_file_path)
+
+    # Lines that only look like top-level entries must not be probed
+    cases = {
+        'desc: "foo\nname: bar"\n': None,
+        "items: [a,\nname: bar]\n": None,
+        "name: first\n---\nname: second\n": RuntimeError,
+    }
+    for yaml_text, expected in cases.items():
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            f.write(yaml_text)
+            yaml_file_path = f.name
+
+        try:
+            config = UniversalConfig().load_file(yaml_file_path, lazy=True)
+            if expected is RuntimeError:
+                with pytest.raises(RuntimeError):
+                    config.get("name")
+            else:
+                assert config.get("name") == expected
+        finally:
+            os.unlink(yaml_file_path)
+    print("test_load_file_lazy passed")
+
+
+def test_load_file_parse_error():
+    """Test that malformed files raise RuntimeError chained to the parser error."""
+    # Truncated document, then valid documents whose top level is not a mapping
+    for text in ('{"app": ', '["ab", "cd"]', "5", "null"):
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            f.write(text)
+            json_file_path = f.name
+
+        try:
+            with pytest.raises(RuntimeError) as excinfo:
+                UniversalConfig().load_file(json_file_path)
+            assert isinstance(excinfo.value.__cause__, ValueError)
+
+            config = UniversalConfig().load_file(json_file_path, lazy=True)
+            with pytest.raises(RuntimeError):
+                config.get("app")
+        finally:
+            os.unlink(json_file_path)
+    print("test_load_file_parse_error passed")
+
+
+def test_get_nested_defaultdict():
+    """Test that dotted lookups never add keys to defaultdict sections."""
+    servers = defaultdict(dict, {"primary": {"host": "db1"}})
+    config = UniversalConfig().load_dict({"servers": servers})
+
+    # Repeat lookups so they also go through the compiled accessor
+    for _ in range(3):
+        assert config.get("servers.primary.host") == "db1"
+        assert config.get("servers.backup.host", "none") == "none"
+    assert "backup" not in servers
+    print("test_get_nested_defaultdict passed")
+
+
 if __name__ == "__main__":
     test_universal_config()
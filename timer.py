@@ -4,11 +4,35 @@ from loguru import logger
 from typing import Callable, Any, Tuple
 
 
+# Below 2**53 whole seconds are exact floats, so splitting off the minutes
+# once and decomposing them as integers gives the same parts as chained
+# float divmods.
+_EXACT_SECONDS = 2.0**53
+
+
 def format_timedelta(seconds: float) -> str:
 
     if seconds < 0:
         return "N/A"
+    if not seconds < _EXACT_SECONDS:
+        # inf, nan and huge values keep the float arithmetic's output.
+        return _format_timedelta_float(seconds)
+
+    minutes, seconds = divmod(seconds, 60)
+    minutes = int(minutes)
+    days = minutes // 1440
+    hours = minutes // 60 % 24
+    minutes %= 60
+
+    return "%s%s%s%.4fs" % (
+        "%dd" % days if days else "",
+        "%dh" % hours if hours else "",
+        "%dm" % minutes if minutes else "",
+        seconds,
+    )
 
+
+def _format_timedelta_float(seconds: float) -> str:
     days, remainder = divmod(seconds, 86400)
     hours, remainder = divmod(remainder, 3600)
     minutes, seconds = divmod(remainder, 60)
@@ -30,15 +54,16 @@ def time_recorder(func: Callable) -> Callable:
 
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Tuple[Any, float]:
-        start_time = time.perf_counter()
+        start_time = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = time.perf_counter()
-        run_time = end_time - start_time
-
-        formatted_time = format_timedelta(run_time)
-
-        logger.info(
-            f"Function '{func.__name__}' ran in {run_time:.4f} seconds ({formatted_time})."
+        run_time = (time.perf_counter_ns() - start_time) / 1e9
+
+        # Lazy arguments: nothing is formatted when INFO is filtered out.
+        logger.opt(lazy=True).info(
+            "Function '{}' ran in {:.4f} seconds ({}).",
+            lambda: func.__name__,
+            lambda: run_time,
+            lambda: format_timedelta(run_time),
         )
 
         return result, run_time
@@ -1,11 +1,365 @@
+import functools
 import os
+import re
+import sys
 from pathlib import Path
-from typing import Any, Dict, Optional, Union, List
+from typing import Any, Callable, Dict, Optional, Union, List
 import yaml
 import json
-import toml
-import configparser
-from dotenv import load_dotenv
+from loguru import logger
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    try:
+        import rtoml as tomllib
+    except ImportError:
+        import tomli as tomllib
+
+try:
+    import orjson
+except ImportError:  # Optional, falls back to the stdlib json module.
+    orjson = None
+
+# orjson reads integers outside the 64-bit range as floats instead of failing.
+# Files with a run of 19+ digits might hold one and are parsed with json.
+_LONG_DIGITS = re.compile(rb"\d{19}")
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader
+
+_libyaml_warning_logged = False
+
+
+def _load_yaml(stream) -> Any:
+    """Parse YAML with the C-accelerated safe loader when it is available."""
+    global _libyaml_warning_logged
+    if SafeLoader is yaml.SafeLoader and not _libyaml_warning_logged:
+        _libyaml_warning_logged = True
+        logger.warning(
+            "PyYAML was built without LibYAML, YAML parsing will be slow. "
+            "Reinstall PyYAML with LibYAML available to enable the C loader."
+        )
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+_INI_DELIMITER = re.compile(r"[=:]")
+
+
+def _parse_ini_fast(text: str) -> Dict[str, Dict[str, str]]:
+    """
+    Parse INI text into a {section: {key: value}} dictionary.
+
+    Covers the subset of configparser used for config files: [section]
+    headers, "key = value" / "key: value" pairs, full-line "#" and ";"
+    comments, continuation lines indented deeper than their key, a [DEFAULT]
+    section whose keys apply to every other section and BasicInterpolation
+    of "%(key)s" and "%%". Keys are lowercased like configparser does.
+    """
+    sections: Dict[str, Dict[str, str]] = {}
+    defaults: Dict[str, str] = {}
+    current = None
+    last_key = None
+    key_indent = 0
+
+    for lineno, line in enumerate(text.splitlines(), 1):
+        stripped = line.strip()
+        if not stripped or stripped[0] in "#;":
+            continue
+
+        indent = len(line) - len(line.lstrip())
+        if last_key is not None and indent > key_indent:
+            current[last_key] += "\n" + stripped
+            continue
+
+        if stripped[0] == "[" and stripped[-1] == "]":
+            name = stripped[1:-1].strip()
+            current = defaults if name == "DEFAULT" else sections.setdefault(name, {})
+            last_key = None
+            continue
+
+        match = _INI_DELIMITER.search(stripped)
+        if current is None or match is None:
+            raise ValueError(f"Invalid INI line {lineno}: {stripped!r}")
+        last_key = stripped[: match.start()].strip().lower()
+        key_indent = indent
+        current[last_key] = stripped[match.end() :].strip()
+
+    result = {name: {**defaults, **values} for name, values in sections.items()}
+    for name, values in result.items():
+        if any("%" in value for value in values.values()):
+            _interpolate_ini_section(name, values)
+    return result
+
+
+def _interpolate_ini_section(name: str, values: Dict[str, str]) -> None:
+    """Resolve "%(key)s" references and "%%" escapes like configparser does."""
+    # Only imported for files that actually use interpolation.
+    import configparser
+
+    parser = configparser.RawConfigParser()
+    interpolation = configparser.BasicInterpolation()
+    try:
+        resolved = {
+            key: interpolation.before_get(parser, name, key, value, values)
+            for key, value in values.items()
+        }
+    except configparser.Error as e:
+        raise ValueError(str(e)) from e
+    values.update(resolved)
+
+
+# Strings longer than this are rarely repeated, interning them only grows
+# the interpreter's intern table.
+_INTERN_MAX_LEN = 64
+
+
+def _intern_strings(obj: Any) -> Any:
+    """
+    Intern dictionary keys and short string values of a parsed config.
+
+    Large configs repeat the same keys ("name", "type", ...) in many nested
+    sections; interning makes them share one object and compare by identity.
+    Containers are updated in place and visited once, so YAML aliases stay
+    shared and recursive aliases do not loop.
+    """
+    seen = set()
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+
+        if isinstance(node, dict):
+            items = list(node.items())
+            node.clear()
+            for k, v in items:
+                if isinstance(k, str):
+                    k = sys.intern(k)
+                if isinstance(v, str) and len(v) < _INTERN_MAX_LEN:
+                    v = sys.intern(v)
+                elif isinstance(v, (dict, list)):
+                    stack.append(v)
+                node[k] = v
+        elif isinstance(node, list):
+            for i, v in enumerate(node):
+                if isinstance(v, str) and len(v) < _INTERN_MAX_LEN:
+                    node[i] = sys.intern(v)
+                elif isinstance(v, (dict, list)):
+                    stack.append(v)
+    return obj
+
+
+# Parsers take the raw file contents. YAML and JSON parse the bytes
+# directly, TOML and INI need text.
+def _parse_yaml(raw: bytes) -> Dict[str, Any]:
+    return _load_yaml(raw) or {}
+
+
+def _parse_json(raw: bytes) -> Dict[str, Any]:
+    if orjson is not None and not _LONG_DIGITS.search(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN or lone surrogates, which json accepts
+    return json.loads(raw.decode("utf-8"))
+
+
+def _parse_toml(raw: bytes) -> Dict[str, Any]:
+    return tomllib.loads(raw.decode("utf-8"))
+
+
+def _parse_ini(raw: bytes) -> Dict[str, Any]:
+    return _parse_ini_fast(raw.decode("utf-8"))
+
+
+_PARSERS: Dict[str, Callable[[bytes], Dict[str, Any]]] = {
+    ".yml": _parse_yaml,
+    ".yaml": _parse_yaml,
+    ".json": _parse_json,
+    ".toml": _parse_toml,
+    ".ini": _parse_ini,
+    ".cfg": _parse_ini,
+}
+
+
+# Everything the parsers raise for malformed input: the JSON and TOML decode
+# errors, UnicodeDecodeError and INI/unsupported-format errors all derive
+# from ValueError. I/O errors are not included and propagate unchanged.
+_PARSE_ERRORS = (yaml.YAMLError, ValueError)
+
+
+def _parse_raw(raw: bytes, suffix: str) -> Dict[str, Any]:
+    """Parse the contents of a configuration file into a dictionary."""
+    parser = _PARSERS.get(suffix)
+    if parser is None:
+        raise ValueError(f"Unsupported configuration file format: {suffix}")
+    data = parser(raw)
+    if not isinstance(data, dict):
+        raise ValueError(
+            f"Configuration file must contain a mapping, not {type(data).__name__}"
+        )
+    return data
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_cached(path_str: str, mtime_ns: int, size: int, suffix: str) -> Dict[str, Any]:
+    """
+    Parse a configuration file into a dictionary.
+
+    Results are memoized on (path, mtime, size), so reloading an unchanged
+    file skips the parse. The returned dictionary is shared and must not be
+    modified; callers copy it with _copy_tree before use. Strings are interned
+    once here, so every copy shares them.
+    """
+    # Read the whole file in one go instead of through a text-mode handle.
+    return _intern_strings(_parse_raw(Path(path_str).read_bytes(), suffix))
+
+
+# orjson parses JSON several times faster than a memoized tree can be copied,
+# so those files skip _parse_cached and are parsed on every load.
+_UNCACHED_SUFFIXES = frozenset({".json"} if orjson is not None else ())
+
+
+_CONTAINER_TYPES = (dict, list, set)
+
+
+def _copy_tree(obj: Any, memo: Optional[Dict[int, Any]] = None) -> Any:
+    """
+    Copy the dicts, lists and sets of a parsed config, sharing everything else.
+
+    Only containers can be changed by merging, set() or callers, and parsed
+    configs hold no other mutable values, so this replaces copy.deepcopy at a
+    fraction of its cost. Shared and recursive containers (YAML aliases) stay
+    shared and recursive in the copy.
+    """
+    cls = type(obj)
+    if cls not in _CONTAINER_TYPES:
+        return obj
+    if memo is None:
+        memo = {}
+    copied = memo.get(id(obj))
+    if copied is not None:
+        return copied
+
+    if cls is set:
+        copied = memo[id(obj)] = set(obj)
+    elif cls is dict:
+        copied = memo[id(obj)] = {}
+        for k, v in obj.items():
+            copied[k] = _copy_tree(v, memo) if type(v) in _CONTAINER_TYPES else v
+    else:
+        copied = memo[id(obj)] = []
+        copied.extend(
+            [_copy_tree(v, memo) if type(v) in _CONTAINER_TYPES else v for v in obj]
+        )
+    return copied
+
+
+_MISSING = object()
+
+# Values the YAML probe cannot read from their own line: block scalars,
+# aliases and (possibly multi-line) flow collections.
+_YAML_PROBE_UNSAFE = b"|>*[{#"
+
+# Matches the blank lines after a "key: value" line and the indentation of
+# the next content line, which is non-empty if that line continues the value.
+_YAML_NEXT_CONTENT = re.compile(rb"(?:[ \t]*\r?\n)+([ \t]*)(\S)")
+
+# Before the matched line, quotes and flow brackets may open a scalar or
+# collection that the line actually belongs to.
+_YAML_OPENERS = re.compile(rb"[\"'\[{]")
+
+# Anywhere in the file: directives, document markers, top-level sequence
+# items and complex keys, which make the file something other than a single
+# plain top-level mapping.
+_YAML_STRUCTURE = re.compile(rb"^(?:%|(?:---|\.\.\.|[-?:])(?:[ \t]|\r?$))", re.M)
+
+
+@functools.lru_cache(maxsize=256)
+def _yaml_key_pattern(key: str) -> "re.Pattern":
+    return re.compile(
+        rb"^" + re.escape(key.encode("utf-8")) + rb":(?=[ \t]|\r?$)(.*)$", re.M
+    )
+
+
+def _probe_yaml(raw: bytes, key: str) -> Any:
+    """
+    Look up a top-level scalar in raw YAML without parsing the document.
+
+    Only plain one-line "key: value" entries of a single-document mapping
+    are recognized, with no quoted scalar or flow collection before them.
+    Returns _MISSING for anything else, and the caller falls back to a full
+    parse.
+    """
+    match = None
+    for match in _yaml_key_pattern(key).finditer(raw):
+        pass  # Duplicate keys: the last one wins, as in a full parse.
+    if match is None:
+        return _MISSING
+    if _YAML_OPENERS.search(raw, 0, match.start()) or _YAML_STRUCTURE.search(raw):
+        return _MISSING
+
+    value = match.group(1).strip()
+    if not value or value[:1] in _YAML_PROBE_UNSAFE:
+        return _MISSING
+    following = _YAML_NEXT_CONTENT.match(raw, match.end())
+    if following and following.group(1) and following.group(2) != b"#":
+        return _MISSING  # Plain scalar continued on the next line.
+
+    try:
+        data = _load_yaml(match.group(0))
+    except yaml.YAMLError:
+        return _MISSING
+    if not isinstance(data, dict) or key not in data or isinstance(data[key], dict):
+        return _MISSING
+    return data[key]
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_key(key: str) -> tuple:
+    """Split a dotted key into its parts, memoized for hot lookups."""
+    return tuple(key.split("."))
+
+
+def _walk_nested(data: Dict, key: str, default: Any) -> Any:
+    """Get a nested value by walking the parts of a dotted key."""
+    for k in _split_key(key):
+        if isinstance(data, dict) and k in data:
+            data = data[k]
+        else:
+            return default
+    return data
+
+
+def _compile_accessor(key: str) -> Callable[[Dict, Any], Any]:
+    """
+    Compile a getter for a dotted key with its path unrolled.
+
+    The generated function performs the same isinstance/in checks as
+    _walk_nested, one straight-line step per key part, so it never triggers
+    __missing__ on dict subclasses. Key parts are embedded as repr() literals.
+    """
+    lines = ["def accessor(data, default, isinstance=isinstance, dict=dict):"]
+    for part in _split_key(key):
+        lines.append(f"    if not isinstance(data, dict) or {part!r} not in data:")
+        lines.append("        return default")
+        lines.append(f"    data = data[{part!r}]")
+    lines.append("    return data")
+    namespace: Dict[str, Any] = {}
+    exec(compile("\n".join(lines), f"<accessor {key!r}>", "exec"), namespace)
+    return namespace["accessor"]
+
+
+# Compiled accessors are shared by all configs. A key is only compiled the
+# second time it is looked up, so one-off keys never pay for compile(), and
+# once _MAX_ACCESSORS keys are compiled the rest keep using the walk.
+_MAX_ACCESSORS = 1024
+_accessors: Dict[str, Callable[[Dict, Any], Any]] = {}
+_seen_keys: set = set()
 
 
 class UniversalConfig:
@@ -14,15 +368,32 @@ class UniversalConfig:
     (YAML, JSON, TOML, INI) and environment variables.
     """
 
+    __slots__ = ("_config", "_lazy")
+
     def __init__(self):
         self._config = {}
+        # (path, raw bytes, suffix, probed) of a file loaded with lazy=True.
+        self._lazy = None
 
-    def load_file(self, file_path: Union[str, Path]) -> "UniversalConfig":
+    def load_file(
+        self, file_path: Union[str, Path], lazy: bool = False
+    ) -> "UniversalConfig":
         """
         Load configuration from a file.
 
+        Parsed files are cached while their mtime and size are unchanged,
+        except JSON files when orjson is installed, which are re-parsed faster
+        than a cached copy can be made. The loaded values are copied into this
+        config, so later changes made through set() stay local to this instance.
+
+        With lazy=True the file is only read, not parsed. The first get() of
+        a top-level key in a YAML file is answered by scanning the raw text
+        for a one-line "key: value" entry; any other access parses the whole
+        file first.
+
         Args:
             file_path: Path to the configuration file.
+            lazy: Defer parsing until the configuration is accessed.
 
         Returns:
             Self for method chaining.
@@ -31,55 +402,122 @@ class UniversalConfig:
         if not path.exists():
             raise FileNotFoundError(f"Configuration file not found: {path}")
 
+        self._materialize()
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                if path.suffix.lower() in [".yml", ".yaml"]:
-                    data = yaml.safe_load(f) or {}
-                elif path.suffix.lower() == ".json":
-                    data = json.load(f)
-                elif path.suffix.lower() == ".toml":
-                    data = toml.load(f)
-                elif path.suffix.lower() in [".ini", ".cfg"]:
-                    config = configparser.ConfigParser()
-                    config.read_file(f)
-                    data = {
-                        k: v
-                        for section in config.sections()
-                        for k, v in config.items(section)
-                    }
-                else:
-                    raise ValueError(
-                        f"Unsupported configuration file format: {path.suffix}"
-                    )
+            if lazy:
+                suffix = path.suffix.lower()
+                if suffix not in _PARSERS:
+                    raise ValueError(f"Unsupported configuration file format: {suffix}")
+                self._lazy = (path, path.read_bytes(), suffix, False)
+                return self
+
+            suffix = path.suffix.lower()
+            if suffix in _UNCACHED_SUFFIXES:
+                data = _parse_raw(path.read_bytes(), suffix)
+            else:
+                st = path.stat()
+                data = _parse_cached(
+                    str(path.resolve()), st.st_mtime_ns, st.st_size, suffix
+                )
+                # The parsed tree is shared through the cache; merge a private copy.
+                data = _copy_tree(data)
+            self._merge_dict(self._config, data)
+        except _PARSE_ERRORS as e:
+            raise RuntimeError(f"Failed to load configuration from {path}: {e}") from e
+
+        return self
+
+    def load_file_header(
+        self, file_path: Union[str, Path], max_bytes: int = 4096
+    ) -> "UniversalConfig":
+        """
+        Load configuration from the first max_bytes of a YAML or TOML file.
+
+        Meant for probing keys written at the top of a file (e.g. app.name or
+        app.version) without parsing all of it, so it only makes sense for
+        files with a stable top-of-file layout. A section cut off by the limit
+        is loaded partially. Other formats, and headers that do not parse on
+        their own, fall back to a full load_file.
+
+        Args:
+            file_path: Path to the configuration file.
+            max_bytes: Number of bytes to read from the start of the file.
+
+        Returns:
+            Self for method chaining.
+        """
+        self._materialize()
+        path = Path(file_path)
+        suffix = path.suffix.lower()
+        if suffix not in (".yml", ".yaml", ".toml"):
+            return self.load_file(path)
 
-                self._merge_dict(self._config, data)
-        except Exception as e:
-            raise RuntimeError(f"Failed to load configuration from {path}: {e}")
+        try:
+            with open(path, "rb") as f:
+                head = f.read(max_bytes + 1)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {path}")
+
+        if len(head) > max_bytes:
+            # Drop the line cut by the limit, it may hold a truncated value.
+            end = head.rfind(b"\n", 0, max_bytes)
+            if end < 0:
+                return self.load_file(path)
+            head = head[: end + 1]
+
+        try:
+            text = head.decode("utf-8")
+            if suffix == ".toml":
+                data = tomllib.loads(text)
+            else:
+                data = _load_yaml(text) or {}
+        except (yaml.YAMLError, ValueError):
+            data = None
 
+        if not isinstance(data, dict):
+            return self.load_file(path)
+        self._merge_dict(self._config, data)
         return self
 
     def load_env(
-        self, dotenv_path: Optional[Union[str, Path]] = None
+        self,
+        dotenv_path: Optional[Union[str, Path]] = None,
+        env_prefix: str = "MYAPP_",
     ) -> "UniversalConfig":
         """
         Load configuration from environment variables or .env file.
 
+        Only variables starting with env_prefix are loaded; the prefix is
+        stripped and the rest of the name lowercased, so MYAPP_DATABASE_HOST
+        becomes database_host. Pass env_prefix="" to load every environment
+        variable under its original name.
+
         Args:
             dotenv_path: Path to the .env file. If None, looks for .env in current directory.
+            env_prefix: Prefix of the environment variables to load.
 
         Returns:
             Self for method chaining.
         """
-        # Load .env file if specified or if .env exists in current directory
-        if dotenv_path:
-            load_dotenv(dotenv_path)
+        self._materialize()
+
+        # Load .env file if specified or if .env exists in current directory.
+        # dotenv is only imported when there actually is a file to read.
+        env_path = Path(dotenv_path) if dotenv_path else Path(".env")
+        if env_path.exists():
+            from dotenv import load_dotenv
+
+            load_dotenv(env_path)
+
+        if env_prefix:
+            prefix_len = len(env_prefix)
+            env_vars = {
+                k[prefix_len:].lower(): v
+                for k, v in os.environ.items()
+                if k.startswith(env_prefix)
+            }
         else:
-            env_path = Path(".env")
-            if env_path.exists():
-                load_dotenv(env_path)
-
-        # Load all environment variables
-        env_vars = dict(os.environ)
+            env_vars = dict(os.environ)
         self._merge_dict(self._config, env_vars)
         return self
 
@@ -93,7 +531,15 @@ class UniversalConfig:
         Returns:
             Self for method chaining.
         """
-        self._merge_dict(self._config, data)
+        self._materialize()
+        # Fresh configs and dictionaries adding only new top-level keys
+        # (the usual load_config(**kwargs) case) need no recursive merge.
+        if not self._config:
+            self._config = dict(data)
+        elif self._config.keys().isdisjoint(data):
+            self._config.update(data)
+        else:
+            self._merge_dict(self._config, data)
         return self
 
     def set(self, key: str, value: Any) -> "UniversalConfig":
@@ -107,6 +553,7 @@ class UniversalConfig:
         Returns:
             Self for method chaining.
         """
+        self._materialize()
         self._set_nested_value(self._config, key, value)
         return self
 
@@ -121,6 +568,14 @@ class UniversalConfig:
         Returns:
             Configuration value or default.
         """
+        if self._lazy is not None:
+            path, raw, suffix, probed = self._lazy
+            if not probed and "." not in key and suffix in (".yml", ".yaml"):
+                value = _probe_yaml(raw, key)
+                if value is not _MISSING:
+                    self._lazy = (path, raw, suffix, True)
+                    return value
+            self._materialize()
         return self._get_nested_value(self._config, key, default)
 
     def get_as(self, key: str, as_type: type, default: Any = None) -> Any:
@@ -152,22 +607,19 @@ class UniversalConfig:
         Get a dictionary of all configuration values with an optional key prefix.
 
         Args:
-            prefix: Optional key prefix to filter values.
+            prefix: Optional key prefix (dot notation, e.g. 'database') selecting
+                the nested section to return.
 
         Returns:
-            Dictionary of configuration values.
+            Shallow copy of the configuration values under the prefix, or an
+            empty dictionary if the prefix does not name a section.
         """
+        self._materialize()
         if not prefix:
             return self._config.copy()
 
-        result = {}
-        prefix_with_dot = prefix + "."
-        for key, value in self._config.items():
-            if key.startswith(prefix_with_dot):
-                result[key[len(prefix_with_dot) :]] = value
-            elif key == prefix:
-                result[""] = value
-        return result
+        section = self._get_nested_value(self._config, prefix, None)
+        return section.copy() if isinstance(section, dict) else {}
 
     def exists(self, key: str) -> bool:
         """
@@ -179,23 +631,44 @@ class UniversalConfig:
         Returns:
             True if the key exists, False otherwise.
         """
+        self._materialize()
         return self._get_nested_value(self._config, key, None) is not None
 
+    def _materialize(self) -> None:
+        """Parse a file loaded with lazy=True and merge it into the config."""
+        if self._lazy is None:
+            return
+        path, raw, suffix, _ = self._lazy
+        self._lazy = None
+        try:
+            data = _parse_raw(raw, suffix)
+        except _PARSE_ERRORS as e:
+            raise RuntimeError(f"Failed to load configuration from {path}: {e}") from e
+        self._merge_dict(self._config, data)
+
     def _merge_dict(self, target: Dict, source: Dict) -> None:
         """Recursively merge source dictionary into target dictionary."""
-        for key, value in source.items():
-            if (
-                key in target
-                and isinstance(target[key], dict)
-                and isinstance(value, dict)
-            ):
-                self._merge_dict(target[key], value)
-            else:
-                target[key] = value
+        # Walk nested dicts with an explicit stack; levels with no shared keys
+        # are merged with a single dict.update.
+        stack = [(target, source)]
+        while stack:
+            target, source = stack.pop()
+            if target.keys().isdisjoint(source):
+                target.update(source)
+                continue
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    target[key] = value
 
     def _set_nested_value(self, data: Dict, key: str, value: Any) -> None:
         """Set a nested value using dot notation."""
-        keys = key.split(".")
+        if "." not in key:
+            data[key] = value
+            return
+        keys = _split_key(key)
         for k in keys[:-1]:
             if k not in data or not isinstance(data[k], dict):
                 data[k] = {}
@@ -204,18 +677,24 @@ class UniversalConfig:
 
     def _get_nested_value(self, data: Dict, key: str, default: Any) -> Any:
         """Get a nested value using dot notation."""
-        keys = key.split(".")
-        for k in keys:
-            if isinstance(data, dict) and k in data:
-                data = data[k]
-            else:
-                return default
-        return data
+        if "." not in key:
+            return data.get(key, default)
+        accessor = _accessors.get(key)
+        if accessor is not None:
+            return accessor(data, default)
+        if key in _seen_keys and len(_accessors) < _MAX_ACCESSORS:
+            accessor = _accessors[key] = _compile_accessor(key)
+            return accessor(data, default)
+        if len(_seen_keys) >= _MAX_ACCESSORS:
+            _seen_keys.clear()
+        _seen_keys.add(key)
+        return _walk_nested(data, key, default)
 
 
 def load_config(
     config_file_path: Optional[Union[str, Path]] = None,
     dotenv_path: Optional[Union[str, Path]] = None,
+    env_prefix: str = "MYAPP_",
     **kwargs,
 ) -> UniversalConfig:
     """
@@ -224,6 +703,7 @@ def load_config(
     Args:
         config_file_path: Path to the configuration file.
         dotenv_path: Path to the .env file.
+        env_prefix: Prefix of the environment variables to load (see UniversalConfig.load_env).
         **kwargs: Additional configuration values.
 
     Returns:
@@ -236,7 +716,7 @@ def load_config(
         config.load_file(config_file_path)
 
     # Load from .env file and environment variables
-    config.load_env(dotenv_path)
+    config.load_env(dotenv_path, env_prefix)
 
     # Load from keyword arguments
     if kwargs: